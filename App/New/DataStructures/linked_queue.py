@@ -13,6 +13,10 @@ class LinkedQueue:
       self._element = element
       self._next = next
 
+  #------------------------------- node pool -------------------------------
+  _node_pool = []                           # nodes released by dequeue, shared by all queues
+  _POOL_LIMIT = 1024                        # most nodes kept for reuse
+
   #------------------------------- queue methods -------------------------------
   def __init__(self):
     """Create an empty queue."""
@@ -33,27 +37,37 @@ class LinkedQueue:
 
     Raise Empty exception if the queue is empty.
     """
-    if self.is_empty():
+    head = self._head                       # None exactly when the queue is empty
+    if head is None:
       raise Empty('Queue is empty')
-    return self._head._element              # front aligned with head of list
+    return head._element                    # front aligned with head of list
 
   def dequeue(self):
     """Remove and return the first element of the queue (i.e., FIFO).
 
     Raise Empty exception if the queue is empty.
     """
-    if self.is_empty():
+    old = self._head                        # None exactly when the queue is empty
+    if old is None:
       raise Empty('Queue is empty')
-    answer = self._head._element
-    self._head = self._head._next
+    answer = old._element
+    self._head = old._next
     self._size -= 1
-    if self.is_empty():                     # special case as queue is empty
+    if self._head is None:                  # special case as queue is empty
       self._tail = None                     # removed head had been the tail
+    old._element = old._next = None         # drop references before the node is reused
+    if len(LinkedQueue._node_pool) < LinkedQueue._POOL_LIMIT:
+      LinkedQueue._node_pool.append(old)
     return answer
 
   def enqueue(self, e):
     """Add an element to the back of queue."""
-    newest = self._Node(e, None)            # node will be new tail node
+    pool = LinkedQueue._node_pool
+    if pool:                                # reuse a released node instead of allocating one
+      newest = pool.pop()
+      newest._element = e
+    else:
+      newest = self._Node(e, None)          # node will be new tail node
     if self.is_empty():
       self._head = newest                   # special case: previously empty
     else:
@@ -61,31 +75,36 @@ class LinkedQueue:
     self._tail = newest                     # update reference to tail node
     self._size += 1
 
-  # Part C:
-  # Solvable by pointing the tail to the head of Q2, but doesn't seem possible due to Q2._head being private
-
-  # added get_head/get_tail/get_size function so head and tail of Q2 can be accessed, not sure if this is part of
-    # intended solution
-  def get_head(self):
-    return self._head
-
-  def get_tail(self):
-    return self._tail
-
-  def get_size(self):
-    return self._size
+  def drain(self):
+    """Remove all elements and return them as a list in FIFO order."""
+    elements = []
+    pool = LinkedQueue._node_pool
+    node = self._head
+    while node is not None:                 # single walk, no per-element dequeue bookkeeping
+      elements.append(node._element)
+      following = node._next
+      node._element = node._next = None     # released nodes go back to the pool, as in dequeue
+      if len(pool) < LinkedQueue._POOL_LIMIT:
+        pool.append(node)
+      node = following
+    self._head = self._tail = None
+    self._size = 0
+    return elements
 
+  # Part C:
+  # Solvable by pointing the tail to the head of Q2; Q2 is also a LinkedQueue, so its _head/_tail/_size can be read
+  # directly (the get_head/get_tail/get_size accessors only added a method call each)
   def concatenate(self, Q2):
     # if current is empty, set head to Q2 head, and tail to Q2 tail
     if self.is_empty():
-      self._head = Q2.get_head()
-      self._tail = Q2.get_tail()
-      self._size = Q2.get_size()
+      self._head = Q2._head
+      self._tail = Q2._tail
+      self._size = Q2._size
     else:
       # Otherwise, connect tail to Q2 head, and set tail to Q2 tail
-      self._tail._next = Q2.get_head()
-      self._tail = Q2.get_tail()
-      self._size += Q2.get_size()
+      self._tail._next = Q2._head
+      self._tail = Q2._tail
+      self._size += Q2._size
 
     # dump Q2 using init
     Q2.__init__()
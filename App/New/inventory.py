@@ -1,11 +1,23 @@
 import datetime
-from typing import List, Optional, Dict, Any
+from bisect import bisect_left, insort
+from typing import List, Optional, Dict, Any, Tuple
+from operator import attrgetter
 import json
-import os
 import sys
-data_structures_path = os.path.abspath('DataStructures')
-sys.path.append(data_structures_path)
-from linked_queue import LinkedQueue
+import time
+
+try:
+    import orjson       # optional: faster save/load, the standard json module is used when it is not installed
+except ImportError:
+    orjson = None
+
+
+# bound format method for one inventory table row (name, padded category column, quantity, price, date); parsed once
+# here instead of the f-string being evaluated piece by piece for every row
+_ROW_FMT = "{:<25} {} {:<10} ${:<9.2f} {:<30}".format
+
+# indentation for each depth of the category tree display, grown on demand so each prefix is only built once
+_TREE_PREFIXES = ['', '  ', '    ', '      ', '        ']
 
 
 # --- New Category Tree Structure ---
@@ -13,27 +25,40 @@ from linked_queue import LinkedQueue
 
 class CategoryNode:
     """Represents a single node in the category hierarchy."""
+    __slots__ = 'name', '_name_lc', 'children'     # streamline memory usage
 
-    # Changed by Zach M. Added variable to track inventory items
     def __init__(self, name: str):
         self.name: str = name
-        self.children: List['CategoryNode'] = []
-        self.items = []
+        self._name_lc: str = name.lower()           # cached lookup key, computed once instead of on every search
+        # children keyed by their lowercased name, dicts keep insertion order so display order is unchanged
+        self.children: Dict[str, 'CategoryNode'] = {}
 
     def to_dict(self) -> Dict[str, Any]:
-        """Converts the node and its children to a serializable dictionary."""
-        return {
-            'name': self.name,
-            'children': [child.to_dict() for child in self.children]
-        }
+        """Iteratively converts the node and its children to a serializable dictionary."""
+        root_dict = {'name': self.name, 'children': []}
+        stack = [(self, root_dict)]  # (node, dictionary being filled for that node)
+
+        while stack:
+            node, node_dict = stack.pop()
+            for child in node.children.values():
+                child_dict = {'name': child.name, 'children': []}
+                node_dict['children'].append(child_dict)
+                stack.append((child, child_dict))
+        return root_dict
 
     @staticmethod
     def from_dict(data: Dict[str, Any]) -> 'CategoryNode':
-        """Recreates a CategoryNode instance from a dictionary."""
-        node = CategoryNode(data['name'])
-        for child_data in data.get('children', []):
-            node.children.append(CategoryNode.from_dict(child_data))
-        return node
+        """Iteratively recreates a CategoryNode instance from a dictionary."""
+        root = CategoryNode(data['name'])
+        stack = [(root, data)]  # (node, dictionary it was created from)
+
+        while stack:
+            node, node_data = stack.pop()
+            for child_data in node_data.get('children', []):
+                child = CategoryNode(child_data['name'])
+                node.children[child._name_lc] = child
+                stack.append((child, child_data))
+        return root
 
 
 # --- Inventory Item Class ---
@@ -42,6 +67,8 @@ class InventoryItem:
     """
     Represents a single item in the inventory, now including a category path.
     """
+    __slots__ = ('name', '_name_lc', 'quantity', 'price', '_category_path', '_category_str', '_category_lc',
+                 'date_added_ts', '_date_str')     # streamline memory usage
 
     def __init__(self, name: str, quantity: int, price: float, category_path: List[str],
                  date_added: Optional[datetime.datetime] = None):
@@ -49,27 +76,117 @@ class InventoryItem:
             raise ValueError("Name cannot be empty, quantity and price must be non-negative.")
 
         self.name: str = name
+        self._name_lc: str = name.lower()           # cached lookup key, computed once instead of on every search
         self.quantity: int = quantity
         self.price: float = price
         self.category_path: List[str] = category_path
-        self.date_added: datetime.datetime = date_added if date_added is not None else datetime.datetime.now()
+        # stored as epoch seconds: a float is smaller than a datetime and sorts with a plain C compare
+        self.date_added_ts: float = date_added.timestamp() if date_added is not None else time.time()
+        self._date_str: Optional[str] = None        # formatted date for display, built on first use
+
+    @property
+    def date_added(self) -> datetime.datetime:
+        """The local date and time the item was added, rebuilt from the stored timestamp."""
+        return datetime.datetime.fromtimestamp(self.date_added_ts)
+
+    @property
+    def date_str(self) -> str:
+        """The date added as shown in the inventory table, formatted once since it never changes."""
+        if self._date_str is None:
+            self._date_str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.date_added_ts))
+        return self._date_str
+
+    @property
+    def category_path(self) -> List[str]:
+        """The category names from the top level category down to the item's own category."""
+        return self._category_path
+
+    @category_path.setter
+    def category_path(self, path: List[str]):
+        """Replaces the category path and drops the strings cached from the old one."""
+        # segments are interned so the many items filed under the same category share one copy of each name
+        self._category_path = [sys.intern(segment) for segment in path]
+        self._category_str: Optional[str] = None    # ' > ' joined category path, built on first use
+        self._category_lc: Optional[str] = None     # lowercased category string, built on first use
+
+    @property
+    def category_str(self) -> str:
+        """The category path joined with ' > ', cached until the path is changed."""
+        if self._category_str is None:
+            self._category_str = ' > '.join(self._category_path)
+        return self._category_str
+
+    @property
+    def category_lc(self) -> str:
+        """Lowercased category string, cached so sorting by category does not rebuild it for every item."""
+        if self._category_lc is None:
+            self._category_lc = self.category_str.lower()
+        return self._category_lc
 
     def __repr__(self):
         """String representation for debugging and display."""
-        category_str = ' > '.join(self.category_path)
         return (f"InventoryItem(Name='{self.name}', Quantity={self.quantity}, "
-                f"Price=${self.price:.2f}, Category='{category_str}')")
+                f"Price=${self.price:.2f}, Category='{self.category_str}')")
 
     def to_dict(self):
-        """Returns a dictionary representation for JSON serialization."""
+        """
+        Returns a dictionary representation for JSON serialization.
+
+        date_added is saved as the stored epoch timestamp, a plain number that needs no formatting or parsing.
+        """
         return {
             'name': self.name,
             'quantity': self.quantity,
             'price': self.price,
-            'date_added': self.date_added.isoformat(),
+            'date_added': self.date_added_ts,
             'category_path': self.category_path
         }
 
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> 'InventoryItem':
+        """
+        Recreates an InventoryItem from a dictionary written by to_dict.
+
+        Saved data was validated when the item was first created, so __init__ is skipped and the slots are filled in
+        directly.
+        """
+        item = InventoryItem.__new__(InventoryItem)
+        item.name = data['name']
+        item._name_lc = item.name.lower()
+        item.quantity = data['quantity']
+        item.price = data['price']
+        # Retrieve category path, defaulting to empty list if missing for backward compatibility
+        item.category_path = data.get('category_path', [])
+        date_added = data['date_added']
+        if isinstance(date_added, str):     # files saved before dates were stored as timestamps hold ISO strings
+            date_added = datetime.datetime.fromisoformat(date_added).timestamp()
+        item.date_added_ts = float(date_added)
+        item._date_str = None
+        return item
+
+
+def encode_item(o: Any) -> Dict[str, Any]:
+    """Converts an InventoryItem reached during JSON encoding, used as the encoder's default hook."""
+    if isinstance(o, InventoryItem):
+        return o.to_dict()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+class InventoryEncoder(json.JSONEncoder):
+    """JSON encoder that converts InventoryItem objects one at a time as they are written."""
+
+    def default(self, o):
+        return encode_item(o)
+
+
+# one shared encoder for the standard json save path; it holds no per-call state, so it is built once instead of on
+# every save. The save file is read back by the program, so it is written compact, without indentation or spaces.
+# Non-ASCII text is written as UTF-8 (not \u escapes), as orjson does
+_INVENTORY_ENCODER = InventoryEncoder(separators=(',', ':'), ensure_ascii=False)
+
+# write buffer for the json save path, large enough that the encoder's small chunks are written out in a few calls
+_SAVE_BUFFER_SIZE = 1 << 20
+
 
 # --- Inventory Manager Class ---
 
@@ -81,32 +198,41 @@ class InventoryManager:
     def __init__(self):
         self.items: List[InventoryItem] = []
 
-        # three-dimensional array, stores name of item and index in the items list
-        self.items_sorted = []
-        self.sorted_by = None
+        # the same items ordered by lowercased name; holds references instead of indexes into self.items, so it
+        # never has to be fixed up when items are removed or re-sorted
+        self.items_sorted: List[InventoryItem] = []
+        # lowercased names of items_sorted, position for position, so bisect compares plain strings in C
+        self._sorted_keys: List[str] = []
+        self.sorted_by = None       # key self.items is currently ordered by, None once an edit breaks the order
+        self._sort_func = None      # key function of sorted_by, used to add new items in order
+        # hash index of items keyed by lowercased name, used for O(1) lookups and duplicate checks
+        self._by_name: Dict[str, InventoryItem] = {}
         # Initialize the root of the category tree (used as a hidden container for top-level categories)
         self.category_tree: CategoryNode = CategoryNode("ROOT")
+        # maps a lowercased category path to its node; the empty path maps to the root
+        self._path_index: Dict[Tuple[str, ...], CategoryNode] = {(): self.category_tree}
+        # materialized path index: every category path prefix maps to the items filed anywhere beneath it, keyed by
+        # lowercased item name so removal is O(1) while insertion order is kept
+        self._items_by_prefix: Dict[Tuple[str, ...], Dict[str, InventoryItem]] = {}
 
         # --- Category Management Methods ---
 
     def find_category_node(self, path: List[str]) -> Optional[CategoryNode]:
-        """Traverses the tree to find a specific node based on its path."""
-        current_node = self.category_tree
+        """Finds a specific node based on its path using the path index."""
+        # An empty path returns the root node (useful for starting iteration)
+        return self._path_index.get(tuple(segment.lower() for segment in path))
 
-        # If path is empty, return the root node (useful for starting iteration)
-        if not path:
-            return current_node
-
-        for segment in path:
-            found = False
-            for child in current_node.children:
-                if child.name.lower() == segment.lower():
-                    current_node = child
-                    found = True
-                    break
-            if not found:
-                return None  # Category path not found
-        return current_node
+    def rebuild_path_index(self):
+        """Rebuilds the path index with one iterative walk of the category tree."""
+        self._path_index = {(): self.category_tree}
+        stack = [(self.category_tree, ())]  # (node, path key)
+
+        while stack:
+            node, key = stack.pop()
+            for name_lc, child in node.children.items():
+                child_key = key + (name_lc,)
+                self._path_index[child_key] = child
+                stack.append((child, child_key))
 
     def add_category(self, path: List[str]):
         """Adds a new category based on the provided path (e.g., ['Electronics', 'Laptops'])."""
@@ -125,12 +251,14 @@ class InventoryManager:
             return
 
         # 2. Check if the category already exists under the parent
-        if any(c.name.lower() == new_category_name.lower() for c in parent_node.children):
+        new_node = CategoryNode(new_category_name)
+        if new_node._name_lc in parent_node.children:
             print(f"[ERROR] Category '{new_category_name}' already exists under this path.")
             return
 
         # 3. Add the new category
-        parent_node.children.append(CategoryNode(new_category_name))
+        parent_node.children[new_node._name_lc] = new_node
+        self._path_index[tuple(segment.lower() for segment in path)] = new_node
         print(f"[SUCCESS] Added category: {' > '.join(path)}")
 
 
@@ -142,58 +270,78 @@ class InventoryManager:
             print("No category tree available.")
             return
 
-        print("\n--- Current Category Tree ---")
-        
-        stack = [(self.category_tree, 0)]  # (node, level)
-        
+        # Lines are collected and written with one call instead of one print() per node
+        lines = ["\n--- Current Category Tree ---"]
+
+        # Children of the hidden ROOT node are pushed directly, so the root never has to be skipped in the loop
+        stack = [(child, 0) for child in reversed(self.category_tree.children.values())]  # (node, depth)
+
         while stack:
-            node, level = stack.pop()
-            
-            # Skip the hidden ROOT node
-            if node.name != "ROOT":
-                prefix = "  " * (level - 1)
-                print(f"{prefix}└── {node.name}")
-            
+            node, depth = stack.pop()
+
+            if depth == len(_TREE_PREFIXES):
+                _TREE_PREFIXES.append(_TREE_PREFIXES[-1] + "  ")
+            lines.append(f"{_TREE_PREFIXES[depth]}└── {node.name}")
+
             # Add children to stack in reverse order to preserve original order
-            for child in reversed(node.children):
-                stack.append((child, level + 1))
-        
-        print("-----------------------------\n")
+            for child in reversed(node.children.values()):
+                stack.append((child, depth + 1))
+
+        lines.append("-----------------------------\n\n")     # blank line after the tree, as print() used to leave
+        sys.stdout.write("\n".join(lines))
 
     # --- Item Management Methods ---
 
-    # Changed by Zach M. now category tree stores items
-    def add_item(self, item: InventoryItem):
-        """Adds a new item to the inventory, ensuring the category exists."""
-        # Improvement: now uses binary search; o(n) -> o(log(n))
-        if self.get_item_by_name(item.name) is not None:
+    def _index_item_path(self, item: InventoryItem):
+        """Files the item under every prefix of its category path."""
+        key = ()
+        for segment in item.category_path:
+            key += (segment.lower(),)
+            self._items_by_prefix.setdefault(key, {})[item._name_lc] = item
+
+    def _unindex_item_path(self, item: InventoryItem):
+        """Removes the item from every prefix of its category path."""
+        key = ()
+        for segment in item.category_path:
+            key += (segment.lower(),)
+            del self._items_by_prefix[key][item._name_lc]
+
+    # Changed by Zach M. now items are also filed by category
+    def add_item(self, item: InventoryItem) -> bool:
+        """Adds a new item to the inventory, ensuring the category exists. Returns whether the item was added."""
+        # Improvement: now uses a hash lookup; o(log(n)) -> o(1)
+        if item._name_lc in self._by_name:
             print(f"[ERROR] Item '{item.name}' already exists.")
-            return
+            return False
 
         # Validate category path before adding item
         category_node = self.find_category_node(item.category_path)
         if item.category_path and not category_node:
             print(f"[ERROR] Category path {' > '.join(item.category_path)} does not exist. Please create it first.")
-            return
-
-        self.items.append(item)
-        if item.category_path:
-            node = category_node
-            node.items.append(item)
+            return False
 
-        sorted_index = self.binary_insertion(item.name)
-        new_item = [item.name, len(self.items) - 1]
-        self.items_sorted.insert(sorted_index, new_item)
+        if self.sorted_by is None:
+            self.items.append(item)
+        else:
+            # keeps the order of the last sort; insort places the item after equal keys, as a stable re-sort would
+            insort(self.items, item, key=self._sort_func)
+        self._by_name[item._name_lc] = item
+        self._index_item_path(item)
+
+        position = self.binary_insertion(item._name_lc)
+        self._sorted_keys.insert(position, item._name_lc)
+        self.items_sorted.insert(position, item)
         print(f"[SUCCESS] Successfully added: {item.name}")
+        return True
 
     def edit_item(self, name: str, new_quantity: Optional[int] = None, new_price: Optional[float] = None,
-                  new_category_path: Optional[List[str]] = None):
-        """Edits the quantity, price, or category of an existing item."""
+                  new_category_path: Optional[List[str]] = None) -> bool:
+        """Edits the quantity, price, or category of an existing item. Returns False if the item does not exist."""
         item = self.get_item_by_name(name)
 
         if not item:
             print(f"[ERROR] Cannot edit. Item '{name}' not found.")
-            return
+            return False
 
         updated_fields = []
 
@@ -201,6 +349,8 @@ class InventoryManager:
         if new_quantity is not None and new_quantity >= 0:
             item.quantity = new_quantity
             updated_fields.append(f"Quantity -> {new_quantity}")
+            if self.sorted_by == 'quantity':
+                self.sorted_by = None
         elif new_quantity is not None and new_quantity < 0:
             print("[WARNING] Quantity must be non-negative. Quantity not changed.")
 
@@ -208,133 +358,83 @@ class InventoryManager:
         if new_price is not None and new_price >= 0:
             item.price = new_price
             updated_fields.append(f"Price -> ${new_price:.2f}")
+            if self.sorted_by == 'price':
+                self.sorted_by = None
         elif new_price is not None and new_price < 0:
             print("[WARNING] Price must be non-negative. Price not changed.")
 
         # Update Category Path
         # CHANGED BY ZACH M: Now also changes items inside tree when category path is updated
         # Bug fix: previously triggered even when not changed because new_category_path input is never none
-        if not new_category_path == []:
-            if new_category_path and not self.find_category_node(new_category_path):
+        # None (the default) and [] both mean "no change"; the new path is validated before the item is unfiled
+        if new_category_path:
+            if not self.find_category_node(new_category_path):
                 print(
                     f"[ERROR] New category path {' > '.join(new_category_path)} does not exist. Category not changed.")
             else:
-                if not item.category_path == []:
-                    node = self.find_category_node(item.category_path)
-                    node.items.remove(item)
+                self._unindex_item_path(item)
                 item.category_path = new_category_path
-                new_node = self.find_category_node(item.category_path)
-                new_node.items.append(item)
-                updated_fields.append(f"Category -> {' > '.join(new_category_path)}")
+                self._index_item_path(item)
+                updated_fields.append(f"Category -> {item.category_str}")
+                if self.sorted_by == 'category':
+                    self.sorted_by = None
 
         if updated_fields:
             print(f"[SUCCESS] Successfully updated '{name}'. Changes: {', '.join(updated_fields)}")
         else:
             print(f"No valid updates provided for '{name}'.")
+        return True
 
-    # may cause issues due to existence in items and not as part of the main program
     def get_item_by_name(self, name: str) -> Optional[InventoryItem]:
         """
-        Retrieves an item by its name using the existing binary_search function.
+        Retrieves an item by its name using the lowercased name index.
 
         Returns:
             - InventoryItem if found
             - None if not found
         """
-
-        # Call the existing binary_search function to get the index
-        index = self.binary_search(name)
-
-        # If index is valid, return the item
-        if index != -1:
-            return self.items[index]
-
-        # Otherwise, item not found
-        return None
+        return self._by_name.get(name.lower())
 
 
     # binary_search implemented by Kwonho Kwan
     # altered by Zach Madison to function with items_sorted instead
-    def binary_search(self, name: str, sorted_index = False):
+    # Improvement: the search loop now runs in C through bisect over the parallel list of lowercased names
+    def binary_search(self, name: str):
         """
-        Performs a binary search on the sorted list self.items to find an item by name.
+        Performs a binary search on the name ordered list self.items_sorted to find an item by name.
 
         Return value:
-            - Returns the index of the matching item if found
+            - Returns the position of the matching item in self.items_sorted if found
             - Returns -1 if the item does not exist
         """
-
-        left, right = 0, len(self.items_sorted) - 1
         target = name.lower()  # Normalize search string for case-insensitive comparison
+        position = bisect_left(self._sorted_keys, target)
 
-        # Iteratively narrow down the search range
-
-        while left <= right:
-            mid = (left + right) // 2
-            current_name = self.items_sorted[mid][0].lower()
-
-            # Case 1: Match found → return index immediately
-            if current_name == target:
-                if not sorted_index:
-                    return self.items_sorted[mid][1]
-                else:
-                    return self.items_sorted[mid][1], mid
-
-            # Case 2: Target name is alphabetically larger than the mid element
-            elif current_name < target:
-                left = mid + 1  # Search in the right half
-
-            # Case 3: Target name is alphabetically smaller than mid element
-            else:
-                right = mid - 1  # Search in the left half
-
-        # If search interval collapses without finding a match, return -1
+        if position < len(self._sorted_keys) and self._sorted_keys[position] == target:
+            return position
         return -1
 
     # Binary Insertion: modified version of binary sort for faster insertion into a sorted list; made by Zach Madison
-    def binary_insertion(self, name):
-        left, right = 0, len(self.items_sorted) - 1
-        target = name.lower()  # Normalize search string for case-insensitive comparison
-
-        # Iteratively narrow down the search range
-        while left <= right:
-            mid = (left + right) // 2
-            current_name = self.items_sorted[mid][0].lower()
-
-            # if match is found return -1 to indicate that the item already exists
-            if current_name == target:
-                breakpoint()
-                return -1
-
-            # if current mid is less than target move left to mid plus one
-            elif current_name < target:
-                left = mid + 1  # Search in the right half
-
-            # last scenario is mid is greater than target, move right to left of mid
-            else:
-                right = mid - 1  # Search in the left half
-
-        # If all options are exhausted value belongs at left
-        return left
+    # Improvement: now uses bisect, see binary_search
+    def binary_insertion(self, name_lc: str):
+        """Returns the position in self.items_sorted where an item with the lowercased name belongs."""
+        return bisect_left(self._sorted_keys, name_lc)
 
     # COMPLETED IMPROVEMENT .remove takes O(N), can be done faster if list is sorted and searched with a binary search.
     # Implemented by Kwanho Kwon
+    # Improvement: items_sorted holds references, so removal no longer rewrites every stored index afterwards
     def remove_item(self, name: str):
-        index, sorted_index = self.binary_search(name, True)
-
-        if index == -1:
+        removed_item = self._by_name.pop(name.lower(), None)
+        if removed_item is None:
             print(f"[ERROR] Item '{name}' not found.")
             return
 
-        removed_item = self.items.pop(index)
-        self.items_sorted.pop(sorted_index)
-        # update item indexes; takes O(N)
-        loop = 0
-        for i in self.items_sorted:
-
-            if i[1] > index:
-                self.items_sorted[loop][1] -= 1
-            loop += 1
+        position = self.binary_search(removed_item.name)
+        del self._sorted_keys[position]
+        del self.items_sorted[position]
+        # list.remove matches the identical object first, so this scan runs entirely in C
+        self.items.remove(removed_item)
+        self._unindex_item_path(removed_item)
 
         print(f"[SUCCESS] Successfully removed: {removed_item.name}")
 
@@ -345,6 +445,18 @@ class InventoryManager:
     # where heap sort only takes O(n) total space (O(1) Auxiliary space)
 
     # COMPLETED: Implemented by Seiya Genda
+    # REVERTED: the heap sort ran every comparison in Python bytecode, 20-50x slower per compare than list.sort.
+    # list.sort computes each key once and compares in C, its O(n) auxiliary space is only a list of references
+
+    # sort key function and label for each valid key, built once with the class rather than on every sort
+    _SORT_KEYS = {
+        'name': (attrgetter('_name_lc'), "Name (Alphabetical)"),      # name is already lowercased once
+        # plain attribute keys use attrgetter, which reads the attribute in C instead of calling a Python lambda
+        'date': (attrgetter('date_added_ts'), "Date Added (Oldest First)"),
+        'quantity': (attrgetter('quantity'), "Quantity (Low to High)"),
+        'price': (attrgetter('price'), "Price (Low to High)"),
+        'category': (attrgetter('category_lc'), "Category Path")
+    }
 
     def sort_inventory(self, key: str):
         """
@@ -352,131 +464,86 @@ class InventoryManager:
         Valid keys: 'name', 'date', 'quantity', 'price', 'category'.
         """
         key = key.lower()
-        self.sorted_by = key
-        sort_key_map = {
-            'name': (lambda item: item.name.lower(), "Name (Alphabetical)"),
-            'date': (lambda item: item.date_added, "Date Added (Oldest First)"),
-            'quantity': (lambda item: item.quantity, "Quantity (Low to High)"),
-            'price': (lambda item: item.price, "Price (Low to High)"),
-            'category': (lambda item: ' > '.join(item.category_path).lower(), "Category Path")
-        }
 
-        if key not in sort_key_map:
+        if key not in self._SORT_KEYS:
             print(f"[ERROR] Invalid sorting key '{key}'. Valid keys are: name, date, quantity, price, category.")
             return
 
-        sort_func, label = sort_key_map[key]
+        sort_func, label = self._SORT_KEYS[key]
 
-        # Use custom heap sort instead of Python's built-in Timsort
-        self.heap_sort(self.items, sort_func)
-        self.reset_sorted_list()
-        print(f"\n[SUCCESS] Inventory sorted by {label} (Heap Sort)")
-
-    # Written by Zach, resets sorted list
-    def reset_sorted_list(self):
-        index = 0
-        # if sorted by name, then list is already in correct positions, O(n) instead
-        if self.sorted_by == "name":
-            for i in range(len(self.items_sorted)):
-                self.items_sorted[i][1] = i
-        else:
-            # Runs in O(n log(n))
-            for i in self.items:
-                sorted_index = self.binary_search(i.name)       # find index of item copy in self.items_sorted
-                self.items_sorted[sorted_index][1] = index      # replace current index with new index
-                index += 1
-
-
-    # -------------------------
-    # Heap Sort Implementation
-    # -------------------------
-    def heapify(self, arr, n, i, key_func):
-        largest = i
-        left = 2 * i + 1
-        right = 2 * i + 2
-
-        if left < n and key_func(arr[left]) > key_func(arr[largest]):
-            largest = left
-        if right < n and key_func(arr[right]) > key_func(arr[largest]):
-            largest = right
-
-        if largest != i:
-            arr[i], arr[largest] = arr[largest], arr[i]
-            self.heapify(arr, n, largest, key_func)
-
-    def heap_sort(self, arr, key_func):
-        n = len(arr)
-
-        # Build max heap
-        for i in range(n // 2 - 1, -1, -1):
-            self.heapify(arr, n, i, key_func)
-
-        # Extract elements one by one
-        for i in range(n - 1, 0, -1):
-            arr[i], arr[0] = arr[0], arr[i]  # swap
-            self.heapify(arr, i, 0, key_func)
+        # Items added since the last sort were inserted in order, so a repeated sort by the same key has nothing to do
+        if key != self.sorted_by:
+            if key == 'name':
+                # items_sorted is always in name order (and names are unique), so it is copied instead of sorted again
+                self.items[:] = self.items_sorted
+            else:
+                # Timsort is stable, so items with equal keys keep their current relative order
+                self.items.sort(key=sort_func)
+        self.sorted_by = key
+        self._sort_func = sort_func
+        print(f"\n[SUCCESS] Inventory sorted by {label}")
 
     # COMPLETED IMPROVEMENT  (issue #6)
     # Originally displayed item by category by going through every possible item and checking the category it
-    # belongs to, now searches the category tree. This implementation saves time in the intended use case scenario.
-    # Worst case of both solutions is the same, original being O(N) where N = items, new is O(N) where
-    # N = category nodes + items belonging to branch
+    # belongs to, then searched the category tree breadth first.
+    # Now every item is filed under each prefix of its category path when it is added (materialized path), so the
+    # items of a whole branch are one dict lookup away: O(1) to find, no tree walk. Costs O(N * depth) references.
 
     # Implemented by Zach Madison
+    def _get_items(self, filter_path: Optional[List[str]] = None):
+        """Returns the inventory items, optionally only those under a category, without copying them."""
+        if not filter_path:
+            return self.items
+
+        return self._items_by_prefix.get(tuple(segment.lower() for segment in filter_path), {}).values()
+
     def display_inventory(self, filter_path: Optional[List[str]] = None):
         """Prints the current inventory items, optionally filtered by category."""
-        if filter_path:
-            items_to_display = []
-            # Find node indicated by path
-            node = self.find_category_node(filter_path)
-
-            current_node = node         # tracks current node, starting with root
-            running = True              # bool for looping
-            next_nodes = LinkedQueue()
-
-            # Use a queue to implement a breadth first search, this allows us to also find items that are children
-            # of other nodes on the specified path
-            while running:
-                for item in current_node.items:
-                    items_to_display.append(item)
-
-                for child in current_node.children:                 # add children of current node to next_nodes queue
-                    next_nodes.enqueue(child)
-
-                if next_nodes.is_empty():                           # if next_nodes is empty, entire tree has been
-                    running = False                                 # searched
-                else:
-                    current_node = next_nodes.dequeue()
-                filter_str = f" in Category: {' > '.join(filter_path)}"
-        else:
-            filter_str = ""
-            items_to_display = self.items
+        filter_str = f" in Category: {' > '.join(filter_path)}" if filter_path else ""
+
+        items_to_display = self._get_items(filter_path)
         if not items_to_display:
             print(f"\n--- Inventory is Empty{filter_str} ---")
             return
 
-        print(f"\n--- Current Inventory{filter_str} ---")
-        print("=" * 110)
-        print(f"{'Name':<25} {'Category Path':<30} {'Quantity':<10} {'Price':<10} {'Date Added':<30}")
-        print("-" * 110)
+        # The whole table is collected and written with one call, print() per line would go through stdout once per line
+        rows = [
+            f"\n--- Current Inventory{filter_str} ---",
+            "=" * 110,
+            f"{'Name':<25} {'Category Path':<30} {'Quantity':<10} {'Price':<10} {'Date Added':<30}",
+            "-" * 110,
+        ]
+        # Items sorted or filtered by category come in runs with the same path; the padded category column is built
+        # once per run and reused (segments are interned, so comparing equal paths is mostly identity checks)
+        prev_path = None
+        category_col = ''
         for item in items_to_display:
-            date_str = item.date_added.strftime('%Y-%m-%d %H:%M:%S')
-            category_str = ' > '.join(item.category_path) if item.category_path else 'Uncategorized'
+            if item.category_path != prev_path:
+                prev_path = item.category_path
+                category_col = f"{item.category_str if prev_path else 'Uncategorized':<30}"
 
-            print(f"{item.name:<25} {category_str:<30} {item.quantity:<10} ${item.price:<9.2f} {date_str:<30}")
-        print("=" * 110 + "\n")
+            rows.append(_ROW_FMT(item.name, category_col, item.quantity, item.price, item.date_str))
+        rows.append("=" * 110 + "\n\n")         # blank line after the table, as print() used to leave
+        sys.stdout.write("\n".join(rows))
 
     # --- Persistence Methods ---
 
     def save_inventory(self, filename: str = "inventory_data.json"):
         """Saves the current inventory and category tree to a JSON file."""
+        # Items are passed as-is and converted by InventoryEncoder while writing, no list of dict copies is built
         data_to_save = {
-            'items': [item.to_dict() for item in self.items],
+            'items': self.items,
             'categories': self.category_tree.to_dict()  # Save the category tree
         }
         try:
-            with open(filename, 'w') as f:
-                json.dump(data_to_save, f, indent=4)
+            if orjson is not None:
+                # orjson encodes straight to bytes in native code, calling encode_item for each item
+                with open(filename, 'wb') as f:
+                    f.write(orjson.dumps(data_to_save, default=encode_item))
+            else:
+                with open(filename, 'w', encoding='utf-8', buffering=_SAVE_BUFFER_SIZE) as f:
+                    # writelines pulls the encoded chunks in C, json.dump would call f.write for each one in Python
+                    f.writelines(_INVENTORY_ENCODER.iterencode(data_to_save))
             print(
                 f"\n[SYSTEM] Successfully saved inventory data ({len(self.items)} items) and categories to '{filename}'.")
         except IOError as e:
@@ -486,37 +553,36 @@ class InventoryManager:
     def load_inventory(self, filename: str = "inventory_data.json"):
         """Loads inventory data and category tree from a JSON file."""
         try:
-            with open(filename, 'r') as f:
-                data_loaded = json.load(f)
+            if orjson is not None:
+                with open(filename, 'rb') as f:
+                    data_loaded = orjson.loads(f.read())
+            else:
+                with open(filename, 'r', encoding='utf-8') as f:
+                    data_loaded = json.load(f)
 
-            self.items.clear()
+            # Every record is parsed before any current state is replaced, so a bad file leaves the inventory as it was
+            # instead of half loaded with the name indexes out of step with the items
+            category_tree = CategoryNode.from_dict(data_loaded['categories']) if 'categories' in data_loaded else None
+            loaded_items = [InventoryItem.from_dict(item_data) for item_data in data_loaded.get('items', [])]
+
+            self.items[:] = loaded_items
+            self.sorted_by = None
+            self._items_by_prefix.clear()
 
             # Load categories first
-            if 'categories' in data_loaded:
-                self.category_tree = CategoryNode.from_dict(data_loaded['categories'])
+            if category_tree is not None:
+                self.category_tree = category_tree
+                self.rebuild_path_index()
                 print("[SYSTEM] Category tree loaded.")
 
             # Load items
-            if 'items' in data_loaded:
-                index = 0
-                for item_data in data_loaded['items']:
-                    date_obj = datetime.datetime.fromisoformat(item_data['date_added'])
-
-                    new_item = InventoryItem(
-                        name=item_data['name'],
-                        quantity=item_data['quantity'],
-                        price=item_data['price'],
-                        date_added=date_obj,
-                        # Retrieve category path, defaulting to empty list if missing for backward compatibility
-                        category_path=item_data.get('category_path', [])
-                    )
-                    self.items.append(new_item)
-                    sorted_index = self.binary_insertion(new_item.name)
-                    self.items_sorted.insert(sorted_index, [new_item.name, index])
-                    index += 1
-                    if new_item.category_path:
-                        node = self.find_category_node(new_item.category_path)
-                        node.items.append(self.items[-1])
+            for new_item in self.items:
+                self._index_item_path(new_item)
+
+            # build the name views in bulk: one sort instead of a binary insertion (and list shift) per item
+            self.items_sorted = sorted(self.items, key=attrgetter('_name_lc'))
+            self._sorted_keys = [item._name_lc for item in self.items_sorted]
+            self._by_name = {item._name_lc: item for item in self.items}
 
             print(f"[SYSTEM] Successfully loaded {len(self.items)} items from '{filename}'.")
 
@@ -533,6 +599,16 @@ class InventoryManager:
 
 # --- Helper Functions for Menu Loop ---
 
+def parse_category_path(path_str: str) -> List[str]:
+    """
+    Splits a category path on greater than signs, or on slashes when there are none, dropping empty segments.
+
+    '>' wins when present so category names containing '/' (e.g. 'Electronics > I/O Devices') stay reachable.
+    """
+    sep = '>' if '>' in path_str else '/'
+    return [segment for segment in (part.strip() for part in path_str.split(sep)) if segment]
+
+
 def main_menu():
     """Displays the main menu options."""
     print("\n" + "#" * 40)
@@ -592,10 +668,7 @@ def get_category_path_input(prompt: str, manager: InventoryManager, required: bo
             return []  # Returns empty list for Uncategorized
 
         # Split path by slashes or greater than signs
-        if '>' in path_str:
-            path_list = [p.strip() for p in path_str.split('>') if p.strip()]
-        else:
-            path_list = [p.strip() for p in path_str.split('/') if p.strip()]
+        path_list = parse_category_path(path_str)
 
         if not path_list:
             if required:
@@ -617,11 +690,7 @@ def category_management_loop(manager: InventoryManager):
             # Add Category
             print("\n--- ADD CATEGORY ---")
             path_str = input("Enter new category path (e.g., Electronics/Laptops or Clothing>Shirts): ").strip()
-
-            if '>' in path_str:
-                path = [p.strip() for p in path_str.split('>') if p.strip()]
-            else:
-                path = [p.strip() for p in path_str.split('/') if p.strip()]
+            path = parse_category_path(path_str)
 
             manager.add_category(path)
 